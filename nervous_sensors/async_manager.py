@@ -1,6 +1,5 @@
 import asyncio
 import logging
-import traceback
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger("nervous")
@@ -11,16 +10,59 @@ class AsyncManager(ABC):
     Abstract base class for asynchronous managers.
 
     This class provides a foundation for implementing asynchronous operations with
-    start and stop capabilities, including a stop event for signaling termination.
+    start and stop capabilities, including a stopping flag for loops and a stop event
+    for signaling termination to waiting coroutines.
     """
 
     def __init__(self):
         """
-        Initialize the AsyncManager with a stop event.
+        Initialize the AsyncManager with a stopping flag.
+
+        The stop event is only created when a subclass awaits it.
         """
-        self._stop_event = asyncio.Event()
+        self._stopping = False
+        self._stop_event = None
         logger.debug(f"Initialized AsyncManager: {self.__class__.__name__}")
 
+    @property
+    def stop_event(self):
+        """
+        Get the stop event, creating it on first use.
+
+        Returns:
+            asyncio.Event: Event set when the manager is stopping.
+        """
+        if self._stop_event is None:
+            self._stop_event = asyncio.Event()
+            if self._stopping:
+                self._stop_event.set()
+        return self._stop_event
+
+    def _signal_stop(self):
+        """
+        Set the stopping flag and wake up coroutines waiting on the stop event.
+        """
+        self._stopping = True
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    async def _wait_stop(self, timeout):
+        """
+        Wait for the stop event for at most the given time.
+
+        Args:
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            bool: True if the manager is stopping, False if the timeout expired.
+        """
+        try:
+            async with asyncio.timeout(timeout):
+                await self.stop_event.wait()
+        except TimeoutError:
+            pass
+        return self._stopping
+
     @abstractmethod
     async def start(self):
         """
@@ -41,9 +83,9 @@ class AsyncManager(ABC):
         their specific asynchronous operations.
         """
         try:
-            logger.info(f"Stopping {self.__class__.__name__}")
-            self._stop_event.set()
+            logger.info("Stopping %s", self.__class__.__name__)
+            self._signal_stop()
         except Exception as e:
-            logger.error(f"Error stopping {self.__class__.__name__}: {e}")
-            logger.debug(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error stopping %s: %s", self.__class__.__name__, e)
+            logger.debug("Traceback", exc_info=True)
             raise
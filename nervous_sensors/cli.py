@@ -1,18 +1,16 @@
 import asyncio
+import atexit
 import logging
 import os
 import sys
-import traceback
 
 import click
 
 from . import utils
 from .cli_listener import CLIListener
 from .connection_manager import ConnectionManager
-from .utils import extract_sensors, print_bold, print_green, print_grey, print_red
+from .utils import extract_sensors, print_bold, print_green, print_grey, print_red, setup_queue_logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("nervous")
 
 
@@ -29,7 +27,13 @@ def cli(sensors, gui, folder, lsl, parallel):
     This function processes command-line arguments, initializes the connection manager,
     and runs the application.
     """
-    # Redirect stdout/stderr to our custom listener to filter certain messages
+    # Log records are written to the terminal by a listener thread
+    log_listener = setup_queue_logging()
+    atexit.register(log_listener.stop)
+
+    # Redirect stdout/stderr to our custom listener to filter certain messages.
+    # The logging handler is configured first and keeps the original stream,
+    # so log records do not go through the listener, only third-party prints do.
     sys.stdout = CLIListener(sys.stdout)
     sys.stderr = CLIListener(sys.stderr)
 
@@ -57,6 +61,11 @@ def cli(sensors, gui, folder, lsl, parallel):
     except (KeyboardInterrupt, OSError) as e:
         logger.info(print_red(f"Application terminated: {str(e)}"))
         logger.info(print_red("Shutting down Nervous framework"))
+        # Fast exit skipping atexit handlers and thread joins, so write the records
+        # still queued for the listener thread and flush pending output first
+        log_listener.stop()
+        sys.stdout.flush()
+        sys.stderr.flush()
         os._exit(os.EX_OK)
 
 
@@ -67,10 +76,13 @@ async def run_app(manager: ConnectionManager):
     Args:
         manager (ConnectionManager): The connection manager instance.
     """
+    # Run the first step of new tasks inline when available (Python 3.12+)
+    if hasattr(asyncio, "eager_task_factory"):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
     try:
-        async with asyncio.TaskGroup() as tg:
-            tg.create_task(manager.start())
+        await manager.start()
     except Exception as e:
         logger.error(print_red(f"Error in connection manager: {str(e)}"))
-        logger.debug(f"Traceback: {traceback.format_exc()}")
+        logger.debug("Traceback", exc_info=True)
         await manager.stop()
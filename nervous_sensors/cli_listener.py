@@ -1,8 +1,12 @@
-import io
 import logging
+import re
+from collections import deque
 
 logger = logging.getLogger("nervous")
 
+# Maximum number of writes kept in the captured content
+CONTENT_MAX_WRITES = 10_000
+
 # List of strings to filter from output
 blacklist = [
     "Flask",
@@ -17,13 +21,19 @@ blacklist = [
     "multicast",
 ]
 
+# Single pattern matching any blacklisted string, scanned once per message
+blacklist_re = re.compile("|".join(re.escape(word) for word in blacklist))
+
+# Messages shorter than this cannot contain any blacklisted string
+blacklist_min_len = min(len(word) for word in blacklist)
+
 
 class CLIListener:
     """
     A custom stream listener that filters certain messages from the output stream.
 
     This class is used to intercept stdout/stderr and filter out unwanted messages
-    while still capturing all output content.
+    while still capturing the most recent output content.
     """
 
     def __init__(self, original_stream):
@@ -34,7 +44,7 @@ class CLIListener:
             original_stream: The original output stream (e.g. sys.stdout).
         """
         self.original_stream = original_stream
-        self.content = io.StringIO()
+        self.content = deque(maxlen=CONTENT_MAX_WRITES)
         logger.debug(f"Initialized CLIListener for stream: {original_stream}")
 
     def write(self, message):
@@ -44,27 +54,32 @@ class CLIListener:
         Args:
             message (str): The message to write.
         """
+        # Short messages (newlines, single tokens) cannot be blacklisted, skip the search
+        if len(message) < blacklist_min_len:
+            self.original_stream.write(message)
+            self.content.append(message)
+            return
+
         # Check if message contains any blacklisted terms
-        if not any(word in message for word in blacklist):
+        if blacklist_re.search(message) is None:
             self.original_stream.write(message)
         else:
             logger.debug(f"Filtered message containing blacklisted content: {message[:50]}...")
 
-        # Always write to internal content buffer
-        self.content.write(message)
+        # Always write to internal content buffer, oldest writes are dropped when full
+        self.content.append(message)
 
     def flush(self):
         """
-        Flush both the original stream and the internal content buffer.
+        Flush the original stream.
         """
         self.original_stream.flush()
-        self.content.flush()
 
     def get_content(self):
         """
-        Get the complete content captured by this listener.
+        Get the content captured by this listener.
 
         Returns:
-            str: The full content written to this stream.
+            str: The last CONTENT_MAX_WRITES messages written to this stream.
         """
-        return self.content.getvalue()
+        return "".join(self.content)
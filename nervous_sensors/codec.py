@@ -1,13 +1,21 @@
 import logging
 import time
-import traceback
+import types
 
 from cobs import cobs
+from google.protobuf.internal import api_implementation
 
 from . import pb2
 
 logger = logging.getLogger("nervous")
 
+# Packets are decoded by the C COBS extension and parsed by the C protobuf backend (upb/cpp),
+# the pure Python fallbacks are much slower
+if not isinstance(cobs.decode, types.BuiltinFunctionType):
+    logger.warning("Pure Python COBS implementation in use, sensor packets decoding will be slow")
+if api_implementation.Type() == "python":
+    logger.warning("Pure Python protobuf backend in use, sensor packets decoding will be slow")
+
 
 class Codec:
     """
@@ -18,7 +26,7 @@ class Codec:
     """
 
     @staticmethod
-    async def time_encode():
+    def time_encode():
         """
         Encode the current time into a protocol buffer Timestamp message.
 
@@ -26,21 +34,21 @@ class Codec:
             bytes: COBS encoded timestamp data with a trailing zero byte.
         """
         try:
-            t = time.time()
+            seconds, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
             timestamp = pb2.Timestamp()
-            timestamp.time = int(t)
-            timestamp.us = int((t - int(t)) * 1_000_000)
+            timestamp.time = seconds
+            timestamp.us = nanoseconds // 1000
             serialized_data = timestamp.SerializeToString()
             encoded_data = cobs.encode(serialized_data)
             encoded_data = encoded_data + b"\x00"
             logger.debug("Time encoded successfully")
             return encoded_data
         except Exception as e:
-            logger.error(f"Error encoding time: {e}")
-            logger.debug(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error encoding time: %s", e)
+            logger.debug("Traceback", exc_info=True)
             raise
 
-    async def cobs_decode(self, data):
+    def cobs_decode(self, data):
         """
         Decode data using the COBS protocol.
 
@@ -51,18 +59,16 @@ class Codec:
             bytes: Decoded data.
         """
         try:
-            data_buffer = bytearray()
-            data_buffer = data[:-1]
-            decoded_data = cobs.decode(data_buffer)
-            logger.debug(f"COBS decoded {len(data)} bytes to {len(decoded_data)} bytes")
+            decoded_data = cobs.decode(data[:-1])
+            logger.debug("COBS decoded %d bytes to %d bytes", len(data), len(decoded_data))
             return decoded_data
         except Exception as e:
-            logger.error(f"Error decoding data with COBS: {e}")
-            logger.debug(f"Traceback: {traceback.format_exc()}")
+            logger.error("Error decoding data with COBS: %s", e)
+            logger.debug("Traceback", exc_info=True)
             raise
 
     # Abstract method to be overridden by each sensor type
-    async def protobuf_decode(self, data):
+    def protobuf_decode(self, data):
         """
         Abstract method to decode protocol buffer data.
         This method should be implemented by each sensor type.
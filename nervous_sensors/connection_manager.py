@@ -1,7 +1,6 @@
 import asyncio
 import logging
 import time
-import traceback
 
 from .async_manager import AsyncManager
 from .folder_manager import FolderManager
@@ -17,6 +16,9 @@ from .utils import print_green, print_red
 # Configure logging
 logger = logging.getLogger("nervous")
 
+# Maximum delay in seconds between two connection attempts of a sensor
+MAX_RETRY_DELAY = 30
+
 
 class ConnectionManager(AsyncManager):
     """
@@ -31,6 +33,10 @@ class ConnectionManager(AsyncManager):
         _sensors (list): List of sensor objects to manage
         _semaphore (asyncio.Semaphore): Controls the number of parallel connection attempts
         _all_connected (asyncio.Event): Event that is set when all sensors are connected
+        _any_disconnected (asyncio.Event): Event that is set when a sensor disconnects
+        _connected_sensors (set): Sensors currently connected, according to the event handlers
+        _connecting_sensors (set): Sensors holding a connection slot of the semaphore
+        _failed_attempts (dict): Number of consecutive failed connection attempts per sensor
         _async_managers (list): List of output managers (GUI, folder, LSL)
     """
 
@@ -65,10 +71,14 @@ class ConnectionManager(AsyncManager):
                     )
             except Exception as e:
                 logger.error(print_red(f"Error initializing sensor {name}: {e}"))
-                logger.debug(traceback.format_exc())
+                logger.debug("Traceback", exc_info=True)
 
         self._semaphore = asyncio.Semaphore(parallel_connection_authorized)
         self._all_connected = asyncio.Event()
+        self._any_disconnected = asyncio.Event()
+        self._connected_sensors = set()
+        self._connecting_sensors = set()
+        self._failed_attempts = {}
         self._notifications_active = False
         self._async_managers = []
 
@@ -97,7 +107,7 @@ class ConnectionManager(AsyncManager):
                 tg.create_task(self.manage_battery_level())
         except Exception as e:
             logger.error(print_red(f"Error starting connection manager: {e}"))
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
 
     async def stop(self):
         """
@@ -108,14 +118,14 @@ class ConnectionManager(AsyncManager):
         """
         logger.info("Stopping connection manager")
         try:
-            self._stop_event.set()
+            self._signal_stop()
             async with asyncio.TaskGroup() as tg:
                 tg.create_task(self.manage_all_disconnections())
                 for async_manager in self._async_managers:
                     tg.create_task(async_manager.stop())
         except Exception as e:
             logger.error(print_red(f"Error stopping connection manager: {e}"))
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
 
     # Event handlers
 
@@ -127,34 +137,42 @@ class ConnectionManager(AsyncManager):
             sensor (NervousSensor): The sensor that failed to connect
         """
         logger.warning(f"{sensor.get_colored_name()}" + print_red(" failed to connect"))
-        self._semaphore.release()
+        self._failed_attempts[sensor] = self._failed_attempts.get(sensor, 0) + 1
+        self._release_connection_slot(sensor)
 
     def on_sensor_connect(self, sensor: NervousSensor):
         """
         Handler for when a sensor successfully connects.
 
         Releases the connection semaphore and sets the all_connected event
-        if all sensors are now connected.
+        if all sensors are now connected. Sensors are tracked in a set so that
+        repeated events for the same sensor are not counted twice.
 
         Args:
             sensor (NervousSensor): The sensor that connected
         """
         logger.info(f"{sensor.get_colored_name()}" + print_green(" connected"))
-        self._semaphore.release()
-        if all(sensor.is_connected() for sensor in self._sensors):
+        self._failed_attempts.pop(sensor, None)
+        self._release_connection_slot(sensor)
+        self._connected_sensors.add(sensor)
+        if len(self._connected_sensors) == len(self._sensors):
+            self._any_disconnected.clear()
             self._all_connected.set()
 
     def on_sensor_disconnect(self, sensor: NervousSensor):
         """
         Handler for when a sensor disconnects.
 
-        Clears the all_connected event since not all sensors are connected.
+        Clears the all_connected event since not all sensors are connected
+        and sets the any_disconnected event.
 
         Args:
             sensor (NervousSensor): The sensor that disconnected
         """
         logger.info(f"{sensor.get_colored_name()}" + print_red(" disconnected"))
+        self._connected_sensors.discard(sensor)
         self._all_connected.clear()
+        self._any_disconnected.set()
 
     # Sensors management
 
@@ -169,7 +187,7 @@ class ConnectionManager(AsyncManager):
             logger.info("All sensors disconnected")
         except Exception as e:
             logger.error(f"Error in manage_all_disconnections: {e}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
 
     async def manage_all_notifications(self):
         """
@@ -179,21 +197,20 @@ class ConnectionManager(AsyncManager):
         starts/stops notifications accordingly. When all sensors are connected,
         it starts notifications; when any sensor disconnects, it stops notifications.
         """
-        while not self._stop_event.is_set():
+        while not self._stopping:
             try:
                 logger.info("Waiting for all sensors to connect")
                 await self._all_connected.wait()
                 logger.info("All sensors connected")
                 await self.start_all_notifications()
                 logger.info("All notifications started")
-                while self._all_connected.is_set():
-                    await asyncio.sleep(0.1)
+                await self._any_disconnected.wait()
                 logger.info("All sensors are not connected")
                 await self.stop_all_notifications()
                 logger.info("All notifications stopped")
             except Exception as e:
                 logger.error(f"Error in manage_all_notifications: {e}")
-                logger.debug(traceback.format_exc())
+                logger.debug("Traceback", exc_info=True)
                 await asyncio.sleep(1)  # Prevent tight loop in case of errors
 
     async def manage_connection(self, sensor):
@@ -202,24 +219,34 @@ class ConnectionManager(AsyncManager):
 
         Continuously attempts to connect the sensor if it's not already connected.
         Uses a semaphore to limit the number of simultaneous connection attempts.
+        The slot is released once the attempt ends, while the connection itself
+        is maintained by sensor.connect(). Retries after failed attempts are
+        delayed with an exponential backoff.
 
         Args:
             sensor (NervousSensor): The sensor to manage connection for
         """
-        while not self._stop_event.is_set():
+        while not self._stopping:
             try:
                 if not sensor.is_connected():
                     await self._semaphore.acquire()
-                    logger.info(f"{sensor.get_colored_name()} tries to connect")
-                    await sensor.connect()
-                # Avoid one sensor monopolizing the semaphore
-                await asyncio.sleep(1)
+                    self._connecting_sensors.add(sensor)
+                    try:
+                        logger.info(f"{sensor.get_colored_name()} tries to connect")
+                        await sensor.connect()
+                    finally:
+                        self._release_connection_slot(sensor)
+                    attempts = self._failed_attempts.get(sensor, 0)
+                    if attempts:
+                        await self._wait_stop(min(2**attempts, MAX_RETRY_DELAY))
+                else:
+                    # Connected without a blocking connect() call, check again later
+                    await self._wait_stop(1)
             except Exception as e:
                 logger.error(f"Error connecting {sensor.get_colored_name()}: {e}")
-                logger.debug(traceback.format_exc())
-                if self._semaphore.locked():
-                    self._semaphore.release()
-                await asyncio.sleep(1)  # Wait before retrying
+                logger.debug("Traceback", exc_info=True)
+                self._failed_attempts[sensor] = self._failed_attempts.get(sensor, 0) + 1
+                await self._wait_stop(min(2 ** self._failed_attempts[sensor], MAX_RETRY_DELAY))
 
     async def manage_battery_level(self):
         """
@@ -227,15 +254,13 @@ class ConnectionManager(AsyncManager):
 
         Battery levels are checked every 2 minutes unless the manager is stopping.
         """
-        while not self._stop_event.is_set():
+        while not self._stopping:
             try:
-                await asyncio.wait_for(self._stop_event.wait(), timeout=120)
-                self.log_battery_level()
-            except TimeoutError:
+                await self._wait_stop(120)
                 self.log_battery_level()
             except Exception as e:
                 logger.error(f"Error checking battery levels: {e}")
-                logger.debug(traceback.format_exc())
+                logger.debug("Traceback", exc_info=True)
                 await asyncio.sleep(60)  # Wait before retrying
 
     # Sensors parallel actions
@@ -283,7 +308,21 @@ class ConnectionManager(AsyncManager):
                 logger.info(message)
             except Exception as e:
                 logger.error(f"Error getting battery level for {sensor.get_colored_name()}: {e}")
-                logger.debug(traceback.format_exc())
+                logger.debug("Traceback", exc_info=True)
+
+    def _release_connection_slot(self, sensor):
+        """
+        Release the connection slot held by a sensor, if any.
+
+        Releasing at most once per acquisition keeps the semaphore balanced
+        whether the attempt ends with an event handler or an exception.
+
+        Args:
+            sensor (NervousSensor): The sensor whose connection attempt ended
+        """
+        if sensor in self._connecting_sensors:
+            self._connecting_sensors.discard(sensor)
+            self._semaphore.release()
 
     async def _run_parallel(self, action):
         """
@@ -298,4 +337,4 @@ class ConnectionManager(AsyncManager):
                     tg.create_task(action(sensor))
         except Exception as e:
             logger.error(f"Error running parallel action: {e}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
@@ -1,19 +1,18 @@
 import logging
-import threading
-import traceback
 from abc import ABC, abstractmethod
 
 import bleak
+import numpy as np
 import pandas as pd
 
 from .codec import Codec
 
 logger = logging.getLogger("nervous")
 
-# Maximum sizes from which the data are truncated and rested
-# using hysteresis for CPU consumption avoidance
-THRESH1 = 12000  # Lower threshold for truncation
-THRESH2 = 20000  # Upper threshold that triggers truncation
+# Number of rows kept in memory for each sensor, oldest rows are overwritten
+BUFFER_SIZE = 20000
+# Attempts to search rows without concurrent overwrite before using the last result
+READ_ATTEMPTS = 3
 
 
 class DataManager(ABC):
@@ -29,9 +28,17 @@ class DataManager(ABC):
         _sensor_name: Name of the associated sensor.
         _sampling_rate: Sampling rate of the sensor in Hz.
         __header: List of column names for the data.
-        __data: List of data rows.
+        __positions: Position of each column, by name.
+        __resolved_columns: Positions and names of the column selections already requested.
+        __data: One preallocated ring buffer of BUFFER_SIZE values per column.
+        __written: Total number of rows published by the producer.
+        __reserved: Total number of rows the producer has started to write.
         __start_time: Start time of data collection (used for timestamp calculation).
-        __lock: Thread lock for ensuring thread-safe data operations.
+
+    The ring buffer is lock-free with a single producer (the sensor data path)
+    and any number of readers: the producer publishes rows by updating __written
+    after copying them, readers copy rows from a snapshot of __written and drop
+    the ones the producer may have overwritten meanwhile (see __reserved).
     """
 
     def __init__(self, sensor_name, sampling_rate, header, start_time, codec: Codec):
@@ -49,9 +56,12 @@ class DataManager(ABC):
         self._sensor_name = sensor_name
         self._sampling_rate = sampling_rate
         self.__header = header
-        self.__data = []
+        self.__positions = {name: i for i, name in enumerate(header)}
+        self.__resolved_columns = {}
+        self.__data = [np.empty(BUFFER_SIZE, dtype=np.float64) for _ in header]
+        self.__written = 0
+        self.__reserved = 0
         self.__start_time = start_time
-        self.__lock = threading.Lock()
 
     def get_header(self):
         """
@@ -62,22 +72,176 @@ class DataManager(ABC):
         """
         return self.__header
 
-    def _add_data(self, data):
+    def _add_data(self, timestamps, values):
         """
         Add new data rows to the data store.
 
-        Implements hysteresis-based truncation to manage memory usage:
-        when data exceeds THRESH2 rows, it's truncated to keep only the
-        last THRESH1 rows.
+        Columns are copied into the ring buffers, overwriting the oldest rows
+        once BUFFER_SIZE rows are stored. Must only be called by the producer.
+
+        Args:
+            timestamps: 1D array-like of the N row timestamps.
+            values: Array-like of the other columns, of shape (N,) for a single column or (N, columns).
+
+        Raises:
+            ValueError: If values do not have one row per timestamp and one column per header column.
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64).reshape(-1)
+        n = len(timestamps)
+        if n == 0:
+            return
+        columns = [timestamps, *np.asarray(values).reshape(n, -1).T]
+        if len(columns) != len(self.__data):
+            raise ValueError(f"Expected {len(self.__data) - 1} value columns, got {len(columns) - 1}")
+        if n > BUFFER_SIZE:
+            columns = [column[-BUFFER_SIZE:] for column in columns]
+            n = BUFFER_SIZE
+
+        written = self.__written
+        head = written % BUFFER_SIZE
+        # Announce the rows being overwritten before copying, publish them once copied
+        self.__reserved = written + n
+        # Split the copy in two when it wraps around the end of the buffer
+        first = min(n, BUFFER_SIZE - head)
+        for buffer, column in zip(self.__data, columns):
+            buffer[head : head + first] = column[:first]
+            buffer[: n - first] = column[first:]
+        self.__written = written + n
+
+    @staticmethod
+    def _get_bounds(written):
+        """
+        Get the ring buffer bounds of the rows stored after a given number of writes.
 
         Args:
-            data: 2D list of data rows to add.
+            written: Total number of rows written.
+
+        Returns:
+            tuple: Physical index of the oldest row and number of stored rows.
+        """
+        count = min(written, BUFFER_SIZE)
+        return (written - count) % BUFFER_SIZE, count
+
+    def _get_column(self, position, written, start=0):
+        """
+        Copy the stored values of a column in chronological order.
+
+        Args:
+            position: Column position to copy.
+            written: Snapshot of the total number of rows written.
+            start: Chronological index of the first row to copy (0 is the oldest stored row).
+
+        Returns:
+            numpy.ndarray: 1D array of the stored values.
+        """
+        buffer = self.__data[position]
+        oldest, count = self._get_bounds(written)
+        first = oldest + start
+        end = oldest + count
+        if end <= BUFFER_SIZE:
+            return buffer[first:end].copy()
+        if first >= BUFFER_SIZE:
+            return buffer[first - BUFFER_SIZE : end - BUFFER_SIZE].copy()
+        return np.concatenate((buffer[first:], buffer[: end - BUFFER_SIZE]))
+
+    def _search_newer(self, column, value, written):
+        """
+        Find the chronological index of the first row newer than a value.
+
+        Relies on the column being sorted in chronological order, as timestamps are.
+
+        Args:
+            column: Position of the sorted column.
+            value: Value from which rows are newer (not included).
+            written: Snapshot of the total number of rows written.
+
+        Returns:
+            int: Chronological index of the first row whose value is greater than the given one.
+        """
+        column_data = self.__data[column]
+        oldest, count = self._get_bounds(written)
+        end = oldest + count
+        if end <= BUFFER_SIZE:
+            return int(np.searchsorted(column_data[oldest:end], value, side="right"))
+        # Rows wrap around the end of the buffer: search the older part, then the newer one
+        older = column_data[oldest:]
+        if older[-1] > value:
+            return int(np.searchsorted(older, value, side="right"))
+        return len(older) + int(np.searchsorted(column_data[: end - BUFFER_SIZE], value, side="right"))
+
+    def _count_overwritten(self, written):
+        """
+        Count the oldest rows of a snapshot that the producer may have overwritten since.
+
+        Args:
+            written: Snapshot of the total number of rows written.
+
+        Returns:
+            int: Number of rows, from the oldest one, that can no longer be trusted.
         """
-        with self.__lock:
-            self.__data.extend(data)
-            if len(self.__data) >= THRESH2:
-                self.__data = self.__data[-THRESH1:]
-                logger.debug(f"Data for {self._sensor_name} truncated to {THRESH1} rows")
+        free = BUFFER_SIZE - min(written, BUFFER_SIZE)
+        return max(self.__reserved - written - free, 0)
+
+    def _resolve_columns(self, columns):
+        """
+        Get the positions and names of selected columns.
+
+        Callers keep requesting the same selections, so they are resolved once and cached.
+
+        Args:
+            columns: Columns to select. Can be names or indices.
+
+        Returns:
+            tuple: List of column positions and list of column names.
+        """
+        key = tuple(columns)
+        resolved = self.__resolved_columns.get(key)
+        if resolved is None:
+            positions = [c if isinstance(c, int) else self.__positions[c] for c in columns]
+            resolved = positions, [self.__header[position] for position in positions]
+            self.__resolved_columns[key] = resolved
+        return resolved
+
+    def _find_newer(self, column, value):
+        """
+        Search the first row newer than a value, retrying if the producer overwrote searched rows.
+
+        Args:
+            column: Position of the sorted column.
+            value: Value from which rows are newer (not included).
+
+        Returns:
+            tuple: Snapshot of the total number of rows written, chronological index from which to copy rows
+                   and whether the copied rows must still be filtered on the column.
+        """
+        for _ in range(READ_ATTEMPTS):
+            written = self.__written
+            start = self._search_newer(column, value, written)
+            # The search only read trusted rows if none before start were overwritten
+            if self._count_overwritten(written) <= start:
+                return written, start, False
+        # Every search overlapped an overwrite so its result is unreliable:
+        # copy from the oldest trusted row and filter the copied rows instead
+        return written, min(self._count_overwritten(written), written, BUFFER_SIZE), True
+
+    def _copy_columns(self, positions, written, start):
+        """
+        Copy the stored values of columns in chronological order, keeping only trusted rows.
+
+        Args:
+            positions: Column positions to copy.
+            written: Snapshot of the total number of rows written.
+            start: Chronological index of the first row to copy (0 is the oldest stored row).
+
+        Returns:
+            list: 1D arrays of the copied values, one for each column.
+        """
+        columns = [self._get_column(position, written, start) for position in positions]
+        # Drop the oldest copied rows if the producer overwrote them during the copy
+        overwritten = self._count_overwritten(written) - start
+        if overwritten > 0:
+            columns = [column[overwritten:] for column in columns]
+        return columns
 
     def get_name(self):
         """
@@ -94,6 +258,7 @@ class DataManager(ABC):
         latest_data=None,
         latest_data_column=0,
         concerned_columns=None,
+        as_numpy=False,
     ):
         """
         Retrieve a subset of the data.
@@ -108,9 +273,10 @@ class DataManager(ABC):
             latest_data_column: Column of the timestamp. Can be a name or an index.
             concerned_columns: Columns to include in the result. Can be names or indices.
                                None to get all columns.
+            as_numpy: Return a 2D NumPy array instead of a DataFrame.
 
         Returns:
-            pandas.DataFrame: The requested subset of data.
+            pandas.DataFrame|numpy.ndarray: The requested subset of data.
 
         Raises:
             ValueError: If both last_n and latest_data are specified.
@@ -118,34 +284,42 @@ class DataManager(ABC):
         if concerned_columns is None:
             concerned_columns = self.__header
 
-        if all(isinstance(c, int) for c in concerned_columns):
-            concerned_columns = [self.__header[c] for c in concerned_columns]
-
-        with self.__lock:
-            try:
-                data = pd.DataFrame(self.__data, columns=self.__header)
-                data = data[concerned_columns]
-
-                if last_n is not None and latest_data is None:
-                    if last_n == -1 or last_n >= data.shape[0]:
-                        return data
-                    else:
-                        return data[-last_n:]
-
-                elif latest_data is not None and last_n is None:
-                    if isinstance(latest_data_column, int):
-                        latest_data_column = self.__header[latest_data_column]
-
-                    if latest_data_column in data.columns:
-                        data = data[data[latest_data_column] > latest_data]
-                        return data
-
-                else:
-                    raise ValueError("Only one of last_n or latest_data can be defined")
-            except Exception as e:
-                logger.error(f"{self._sensor_name} DataManager error: {str(e)}")
-                logger.debug(traceback.format_exc())
-                return pd.DataFrame(columns=concerned_columns)  # Return empty DataFrame on error
+        try:
+            # Rows are selected on the buffer so only returned rows are turned into a DataFrame
+            positions, names = self._resolve_columns(concerned_columns)
+
+            if last_n is not None and latest_data is None:
+                written = self.__written
+                count = min(written, BUFFER_SIZE)
+                start = 0 if last_n == -1 else max(count - last_n, 0)
+                filtered = False
+
+            elif latest_data is not None and last_n is None:
+                if not isinstance(latest_data_column, int):
+                    latest_data_column = self.__positions[latest_data_column]
+
+                written, start, filtered = self._find_newer(latest_data_column, latest_data)
+                if filtered:
+                    # Copy the searched column along with the selected ones to filter them
+                    positions = [*positions, latest_data_column]
+
+            else:
+                raise ValueError("Only one of last_n or latest_data can be defined")
+
+            columns = self._copy_columns(positions, written, start)
+            if filtered:
+                newer = columns.pop() > latest_data
+                columns = [column[newer] for column in columns]
+            if as_numpy:
+                return np.column_stack(columns)
+            return pd.DataFrame(dict(zip(names, columns)), copy=False)
+        except Exception as e:
+            logger.error(f"{self._sensor_name} DataManager error: {str(e)}")
+            logger.debug("Traceback", exc_info=True)
+            # Return empty data on error
+            if as_numpy:
+                return np.empty((0, len(concerned_columns)))
+            return pd.DataFrame(columns=concerned_columns)
 
     @abstractmethod
     def _process_decoded_data(self, timestamp, data):
@@ -165,11 +339,14 @@ class DataManager(ABC):
         """
         Create a callback function for receiving BLE characteristic notifications.
 
+        The callback is synchronous so that bleak calls it directly from the
+        notification handler instead of scheduling a new task for every packet.
+
         Returns:
-            function: Async callback function that processes received BLE data.
+            function: Callback function that processes received BLE data.
         """
 
-        async def data_callback(sender: bleak.BleakGATTCharacteristic, data: bytearray):
+        def data_callback(sender: bleak.BleakGATTCharacteristic, data: bytearray):
             """
             Process BLE characteristic notifications.
 
@@ -180,12 +357,12 @@ class DataManager(ABC):
                 data: The raw data received from the characteristic.
             """
             try:
-                data = await self._codec.cobs_decode(data)
-                data, timestamp = await self._codec.protobuf_decode(data)
+                data = self._codec.cobs_decode(data)
+                data, timestamp = self._codec.protobuf_decode(data)
                 timestamp -= self.__start_time
                 self._process_decoded_data(timestamp, data)
             except Exception as e:
                 logger.error(f"{self._sensor_name} data callback error: {str(e)}")
-                logger.debug(traceback.format_exc())
+                logger.debug("Traceback", exc_info=True)
 
         return data_callback
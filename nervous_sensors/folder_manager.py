@@ -2,23 +2,44 @@ import asyncio
 import csv
 import logging
 import os
-import traceback
+from dataclasses import dataclass
+from typing import Any, TextIO
 
 from .async_manager import AsyncManager
 
 logger = logging.getLogger("nervous")
 
 
+@dataclass(slots=True)
+class SensorFile:
+    """
+    CSV file of a sensor and its write state.
+
+    Attributes:
+        sensor: The sensor object whose data is written.
+        path: Path of the CSV file.
+        file: CSV file, kept open while the manager runs.
+        writer: CSV writer of the file.
+        time: Timestamp of the last written row.
+    """
+
+    sensor: Any
+    path: str
+    file: TextIO
+    writer: Any
+    time: float = 0
+
+
 class FolderManager(AsyncManager):
     """
     Manages the storage of sensor data to CSV files in a specified folder.
 
     This class periodically writes sensor data to CSV files, creating a separate file
     for each sensor. It handles file creation, appending new data, and manages
-    file paths.
+    file paths. Files stay open while the manager runs.
 
     Attributes:
-        _sensor_times: List of dictionaries containing sensor objects and their last write time.
+        _sensor_files: List of SensorFile, one for each sensor.
         _folder_path: Path to the folder where CSV files will be saved.
         _update_time: Time interval in seconds between data writes.
     """
@@ -33,13 +54,7 @@ class FolderManager(AsyncManager):
             update_time: Time interval in seconds between data writes (default: 5.0).
         """
         super().__init__()
-        self._sensor_times = [
-            {
-                "sensor": sensor,
-                "time": 0,
-            }
-            for sensor in sensors
-        ]
+        self._sensor_files = []
         self._folder_path = folder_path
         self._update_time = update_time
 
@@ -49,16 +64,17 @@ class FolderManager(AsyncManager):
                 os.makedirs(folder_path, exist_ok=True)
 
             # Create the csv files with header
-            for sensor_time in self._sensor_times:
-                sensor = sensor_time["sensor"]
+            for sensor in sensors:
                 path = self.get_path(sensor)
                 header = sensor.data_manager.get_header()
-                with open(path, "w", newline="") as f_object:
-                    writer = csv.DictWriter(f_object, fieldnames=header, delimiter=";")
-                    writer.writeheader()
+                f_object = open(path, "w", newline="")
+                writer = csv.DictWriter(f_object, fieldnames=header, delimiter=";")
+                writer.writeheader()
+                f_object.flush()
+                self._sensor_files.append(SensorFile(sensor, path, f_object, csv.writer(f_object, delimiter=";")))
         except Exception as e:
             logger.error(f"Error initializing folder manager: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
             raise
 
     def get_path(self, sensor):
@@ -72,27 +88,28 @@ class FolderManager(AsyncManager):
             str: The complete file path for the sensor's CSV file.
         """
         name = sensor.get_name()
-        return f"{self._folder_path}/{sensor.get_start_time_str()}_{name}.csv"
+        return os.path.join(self._folder_path, f"{sensor.get_start_time_str()}_{name}.csv")
 
     async def start(self):
         """
         Start the folder manager to periodically write sensor data to CSV files.
 
         Runs a loop that periodically writes all sensor data to their respective CSV files
-        until the stop event is set.
+        until the stop event is set, then closes the files.
         """
         logger.info("Starting Folder manager")
         logger.info(f"Data files will be created in folder {self._folder_path}")
 
-        while not self._stop_event.is_set():
-            try:
-                await asyncio.wait_for(self._stop_event.wait(), timeout=self._update_time)
-                await self.write_all_csv()
-            except asyncio.TimeoutError:
-                await self.write_all_csv()
-            except Exception as e:
-                logger.error(f"Error in folder manager loop: {str(e)}")
-                logger.debug(traceback.format_exc())
+        try:
+            while not self._stopping:
+                try:
+                    await self._wait_stop(self._update_time)
+                    await self.write_all_csv()
+                except Exception as e:
+                    logger.error(f"Error in folder manager loop: {str(e)}")
+                    logger.debug("Traceback", exc_info=True)
+        finally:
+            self.close_all_csv()
 
     async def stop(self):
         """
@@ -101,43 +118,53 @@ class FolderManager(AsyncManager):
         Sets the stop event to terminate the running loop.
         """
         logger.info("Stopping Folder manager")
-        self._stop_event.set()
+        self._signal_stop()
 
     async def write_all_csv(self):
         """
         Write data from all sensors to their respective CSV files.
 
-        Creates a task for each sensor to write its data concurrently.
+        Files are written one after the other in a single worker thread, as writes
+        are blocking and would otherwise stall the event loop.
         """
         try:
-            async with asyncio.TaskGroup() as tg:
-                for sensor_time in self._sensor_times:
-                    tg.create_task(self.write_csv(sensor_time))
+            await asyncio.to_thread(self._write_all_csv_sync)
         except Exception as e:
             logger.error(f"Error writing all CSV files: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
+
+    def _write_all_csv_sync(self):
+        """
+        Write data from all sensors to their respective CSV files, blocking until done.
+        """
+        for sensor_file in self._sensor_files:
+            self.write_csv(sensor_file)
 
-    async def write_csv(self, sensor_time):
+    def write_csv(self, sensor_file):
         """
-        Write data from a specific sensor to its CSV file.
+        Write data from a specific sensor to its CSV file and flush it to disk.
 
         Only writes data that has been collected since the last write operation.
 
         Args:
-            sensor_time: Dictionary containing the sensor object and its last write time.
+            sensor_file: SensorFile of the sensor.
         """
-        sensor = sensor_time["sensor"]
-        time = sensor_time["time"]
-        file_path = self.get_path(sensor)
+        sensor = sensor_file.sensor
 
         try:
-            with open(file_path, "a", newline="") as f_object:
-                writer_object = csv.writer(f_object, delimiter=";")
-                new_data = sensor.data_manager.get_latest_data(latest_data=time)
-                rows = new_data.values.tolist()
-                writer_object.writerows(rows)
-                if not new_data.empty:
-                    sensor_time["time"] = new_data.iloc[-1, 0]
+            new_data = sensor.data_manager.get_latest_data(latest_data=sensor_file.time, as_numpy=True)
+            if len(new_data) == 0:
+                return
+            sensor_file.writer.writerows(new_data.tolist())
+            sensor_file.file.flush()
+            sensor_file.time = new_data[-1, 0]
         except Exception as e:
             logger.error(f"Error writing CSV for sensor {sensor.get_name()}: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
+
+    def close_all_csv(self):
+        """
+        Close the CSV files of all sensors.
+        """
+        for sensor_file in self._sensor_files:
+            sensor_file.file.close()
@@ -1,10 +1,11 @@
 import asyncio
+import atexit
 import logging
 import os
-import pathlib
 import sys
 import threading
 import tkinter as tk
+import weakref
 import webbrowser
 from tkinter import PhotoImage, filedialog, messagebox, ttk
 from typing import Optional
@@ -13,12 +14,19 @@ from .cli_listener import CLIListener
 
 # Import your existing modules
 from .connection_manager import ConnectionManager
-from .utils import extract_sensors
+from .utils import extract_sensors, setup_queue_logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger("nervous_gui")
 
+# Window icon, shipped next to this module
+ICON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icon.png")
+
+# Sensor status polling interval in seconds, from while the status changes to once it is stable
+STATUS_POLL_MIN_INTERVAL = 0.25
+STATUS_POLL_MAX_INTERVAL = 5.0
+# Factor applied to the polling interval each time the status is unchanged
+STATUS_POLL_BACKOFF = 1.5
+
 
 class ModernStyle:
     """Modern dark theme color palette and styling"""
@@ -42,9 +50,19 @@ class ModernStyle:
     BORDER = "#555555"  # Border color
     HOVER = "#404040"  # Hover state
 
+    # Tk roots whose styles are already configured
+    _configured_roots = weakref.WeakSet()
+
     @classmethod
     def configure_styles(cls, style: ttk.Style):
-        """Configure modern dark theme styles"""
+        """
+        Configure modern dark theme styles.
+
+        Styles are global to the Tk interpreter, so they are only configured once for each root.
+        """
+        if style.master in cls._configured_roots:
+            return
+        cls._configured_roots.add(style.master)
 
         # Configure the theme
         style.theme_use("clam")
@@ -194,12 +212,20 @@ class ModernStyle:
         )
 
 
+# Displayed (text, color) of the connection and notification status of a sensor
+CONNECTION_STATES = {True: ("Connected", ModernStyle.ACCENT_GREEN), False: ("Disconnected", ModernStyle.ACCENT_RED)}
+NOTIFICATION_STATES = {True: ("Active", ModernStyle.ACCENT_GREEN), False: ("Inactive", ModernStyle.ACCENT_ORANGE)}
+
+
 class SensorStatusFrame(ttk.Frame):
     """Frame to display sensor status information with modern styling"""
 
     def __init__(self, parent):
         super().__init__(parent, style="Modern.TFrame")
         self.sensor_labels = {}
+        # Last displayed (connected, notifications) state of each sensor, to skip unchanged updates
+        self._last_state = {}
+        self._last_any_connected = False
         self.setup_ui()
 
     def setup_ui(self):
@@ -222,9 +248,8 @@ class SensorStatusFrame(ttk.Frame):
         self.status_indicator.pack(side="right")
 
         # Headers with modern styling
-        headers_frame = ttk.Frame(self, style="Secondary.TFrame")
+        headers_frame = ttk.Frame(self, style="Secondary.TFrame", padding=10)
         headers_frame.pack(fill="x", pady=(0, 10))
-        headers_frame.configure(padding=10)
 
         headers_frame.columnconfigure(0, weight=1)
         headers_frame.columnconfigure(1, weight=1)
@@ -262,9 +287,8 @@ class SensorStatusFrame(ttk.Frame):
         """Update the status of a specific sensor with modern styling"""
         if sensor_name not in self.sensor_labels:
             # Create new sensor row with modern styling
-            row_frame = ttk.Frame(self.sensors_frame, style="Secondary.TFrame")
+            row_frame = ttk.Frame(self.sensors_frame, style="Secondary.TFrame", padding=10)
             row_frame.pack(fill="x", pady=2)
-            row_frame.configure(padding=10)
 
             row_frame.columnconfigure(0, weight=1)
             row_frame.columnconfigure(1, weight=1)
@@ -281,9 +305,8 @@ class SensorStatusFrame(ttk.Frame):
             name_label.grid(row=0, column=0, sticky="w", padx=10)
 
             # Connection status
-            conn_frame = ttk.Frame(row_frame, style="Modern.TFrame")
+            conn_frame = ttk.Frame(row_frame, style="Secondary.TFrame")
             conn_frame.grid(row=0, column=1, sticky="w", padx=10)
-            conn_frame.configure(style="Secondary.TFrame")
 
             conn_indicator = ttk.Label(
                 conn_frame, text="●", font=("Segoe UI", 12), background=ModernStyle.BG_SECONDARY
@@ -294,9 +317,8 @@ class SensorStatusFrame(ttk.Frame):
             conn_label.pack(side="left")
 
             # Notification status
-            notif_frame = ttk.Frame(row_frame, style="Modern.TFrame")
+            notif_frame = ttk.Frame(row_frame, style="Secondary.TFrame")
             notif_frame.grid(row=0, column=2, sticky="w", padx=10)
-            notif_frame.configure(style="Secondary.TFrame")
 
             notif_indicator = ttk.Label(
                 notif_frame, text="●", font=("Segoe UI", 12), background=ModernStyle.BG_SECONDARY
@@ -313,39 +335,37 @@ class SensorStatusFrame(ttk.Frame):
                 "notification_label": notif_label,
             }
 
+        # Skip widget updates if the displayed state did not change
+        state = (connected, notifications)
+        if self._last_state.get(sensor_name) == state:
+            return
+        self._last_state[sensor_name] = state
+
+        labels = self.sensor_labels[sensor_name]
+
         # Update connection status
-        if connected:
-            self.sensor_labels[sensor_name]["connection_indicator"].config(foreground=ModernStyle.ACCENT_GREEN)
-            self.sensor_labels[sensor_name]["connection_label"].config(
-                text="Connected", foreground=ModernStyle.ACCENT_GREEN
-            )
-        else:
-            self.sensor_labels[sensor_name]["connection_indicator"].config(foreground=ModernStyle.ACCENT_RED)
-            self.sensor_labels[sensor_name]["connection_label"].config(
-                text="Disconnected", foreground=ModernStyle.ACCENT_RED
-            )
+        text, color = CONNECTION_STATES[connected]
+        labels["connection_indicator"].config(foreground=color)
+        labels["connection_label"].config(text=text, foreground=color)
 
         # Update notification status
-        if notifications:
-            self.sensor_labels[sensor_name]["notification_indicator"].config(foreground=ModernStyle.ACCENT_GREEN)
-            self.sensor_labels[sensor_name]["notification_label"].config(
-                text="Active", foreground=ModernStyle.ACCENT_GREEN
-            )
-        else:
-            self.sensor_labels[sensor_name]["notification_indicator"].config(foreground=ModernStyle.ACCENT_ORANGE)
-            self.sensor_labels[sensor_name]["notification_label"].config(
-                text="Inactive", foreground=ModernStyle.ACCENT_ORANGE
-            )
+        text, color = NOTIFICATION_STATES[notifications]
+        labels["notification_indicator"].config(foreground=color)
+        labels["notification_label"].config(text=text, foreground=color)
 
-        # Update main status indicator
-        any_connected = any(connected for connected in [connected])  # This would be expanded for multiple sensors
-        self.status_indicator.config(foreground=ModernStyle.ACCENT_GREEN if any_connected else ModernStyle.ACCENT_RED)
+        # Update main status indicator, green while at least one sensor is connected
+        any_connected = any(connected for connected, _ in self._last_state.values())
+        if any_connected != self._last_any_connected:
+            self._last_any_connected = any_connected
+            self.status_indicator.config(foreground=CONNECTION_STATES[any_connected][1])
 
     def clear_sensors(self):
         """Clear all sensor status displays"""
         for widget in self.sensors_frame.winfo_children():
             widget.destroy()
         self.sensor_labels.clear()
+        self._last_state.clear()
+        self._last_any_connected = False
         self.status_indicator.config(foreground=ModernStyle.ACCENT_RED)
 
 
@@ -358,6 +378,7 @@ class NervousGUI:
         self.event_loop: Optional[asyncio.AbstractEventLoop] = None
         self.event_loop_thread: Optional[threading.Thread] = None
         self.is_running = False
+        self._poll_interval = STATUS_POLL_MIN_INTERVAL
 
         # GUI state variables
         self.sensors_var = tk.StringVar()
@@ -369,6 +390,10 @@ class NervousGUI:
         self.dash_port = 6378  # Default Dash port
 
         self.sensor_list = []
+        # Same sensors as sensor_list, for duplicate checks
+        self._sensor_set: set[str] = set()
+        # Sensor list and its extracted sensors at the last start
+        self._sensor_cache: Optional[tuple[tuple[str, ...], list]] = None
 
         self.setup_ui()
         self.setup_logging()
@@ -382,11 +407,7 @@ class NervousGUI:
         """Setup the modern user interface"""
         self.root.title("Nervous Control Panel")
         self.root.geometry("900x900")
-        img_file_name = "icon.png"
-        current_dir = pathlib.Path(__file__).parent.resolve()  # current directory
-        img_path = os.path.join(current_dir, img_file_name)  # join with your image's file name
-        icon = PhotoImage(file=img_path)
-        self.root.iconphoto(True, icon)
+        self.root.iconphoto(True, PhotoImage(file=ICON_PATH))
         self.root.resizable(True, True)
         self.root.configure(bg=ModernStyle.BG_SECONDARY)
 
@@ -542,9 +563,8 @@ class NervousGUI:
         system_frame = ttk.LabelFrame(parent, text="⚙️ System Status", style="Modern.TLabelframe", padding=15)
         system_frame.pack(fill="x", pady=(0, 20))
 
-        status_container = ttk.Frame(system_frame, style="Secondary.TFrame")
+        status_container = ttk.Frame(system_frame, style="Secondary.TFrame", padding=15)
         status_container.pack(fill="x")
-        status_container.configure(padding=15)
 
         self.status_label = ttk.Label(
             status_container,
@@ -590,11 +610,12 @@ class NervousGUI:
     def add_sensor(self):
         """Add a sensor to the list"""
         sensor_name = self.sensor_entry.get().strip()
-        if sensor_name and sensor_name not in self.sensor_list:
+        if sensor_name and sensor_name not in self._sensor_set:
             self.sensor_list.append(sensor_name)
+            self._sensor_set.add(sensor_name)
             self.sensor_listbox.insert(tk.END, f"📡 {sensor_name}")
             self.sensor_entry.delete(0, tk.END)
-        elif sensor_name in self.sensor_list:
+        elif sensor_name in self._sensor_set:
             messagebox.showwarning(
                 "Duplicate Sensor", f"Sensor '{sensor_name}' is already in the list.", parent=self.root
             )
@@ -607,6 +628,7 @@ class NervousGUI:
             sensor_text = self.sensor_listbox.get(index)
             sensor_name = sensor_text.replace("📡 ", "")
             self.sensor_list.remove(sensor_name)
+            self._sensor_set.discard(sensor_name)
             self.sensor_listbox.delete(index)
 
     def browse_folder(self):
@@ -638,8 +660,13 @@ class NervousGUI:
             return
 
         try:
-            # Validate sensors
-            true_sensors = extract_sensors(self.sensor_list)
+            # Validate sensors, unless the list did not change since the last start
+            key = tuple(self.sensor_list)
+            if self._sensor_cache is not None and self._sensor_cache[0] == key:
+                true_sensors = self._sensor_cache[1]
+            else:
+                true_sensors = extract_sensors(self.sensor_list)
+                self._sensor_cache = (key, true_sensors)
             if not true_sensors:
                 messagebox.showerror(
                     "Invalid Sensors", "No valid sensors found. Please check sensor names.", parent=self.root
@@ -742,14 +769,30 @@ class NervousGUI:
         self.event_loop_thread.start()
 
     async def update_sensor_status_periodically(self):
-        """Periodically update sensor status in the GUI"""
+        """
+        Periodically update sensor status in the GUI.
+
+        Polls quickly while the status changes and backs off while it is stable.
+        """
+        self._poll_interval = STATUS_POLL_MIN_INTERVAL
+        last_snapshot = None
         try:
             while self.is_running:
-                if self.connection_manager:
-                    for sensor in self.connection_manager._sensors:
-                        # Schedule GUI update on main thread
-                        self.root.after(0, lambda s=sensor: self.update_sensor_gui_status(s))
-                await asyncio.sleep(1)  # Update every second
+                connection_manager = self.connection_manager
+                if connection_manager:
+                    # Read the status of every sensor here and schedule a single GUI update on main thread
+                    notifications_active = connection_manager.are_notifications_active()
+                    snapshot = []
+                    for sensor in connection_manager._sensors:
+                        connected = sensor.is_connected()
+                        snapshot.append((sensor.get_name(), connected, connected and notifications_active))
+                    if snapshot != last_snapshot:
+                        last_snapshot = snapshot
+                        self._poll_interval = STATUS_POLL_MIN_INTERVAL
+                        self.root.after(0, self.apply_sensor_status_batch, snapshot)
+                    else:
+                        self._poll_interval = min(self._poll_interval * STATUS_POLL_BACKOFF, STATUS_POLL_MAX_INTERVAL)
+                await asyncio.sleep(self._poll_interval)
         except (asyncio.CancelledError, RuntimeError):
             # Normal shutdown, ignore these errors
             pass
@@ -757,18 +800,13 @@ class NervousGUI:
             if self.is_running:
                 logger.error(f"Error updating sensor status: {e}")
 
-    def update_sensor_gui_status(self, sensor):
-        """Update sensor status in GUI (called from main thread)"""
-        try:
-            connected = sensor.is_connected()
-            # Get actual notification status from connection manager
-            notifications = (
-                connected and self.connection_manager and self.connection_manager.are_notifications_active()
-            )
-
-            self.sensor_status_frame.update_sensor_status(sensor.get_name(), connected, notifications)
-        except Exception as e:
-            logger.error(f"Error updating GUI status for sensor: {e}")
+    def apply_sensor_status_batch(self, snapshot):
+        """Update the status of all sensors in GUI (called from main thread)"""
+        for sensor_name, connected, notifications in snapshot:
+            try:
+                self.sensor_status_frame.update_sensor_status(sensor_name, connected, notifications)
+            except Exception as e:
+                logger.error(f"Error updating GUI status for sensor: {e}")
 
     def handle_event_loop_error(self, error_msg):
         """Handle errors from the event loop thread"""
@@ -835,6 +873,11 @@ class NervousGUI:
 
 def gui():
     """Main entry point for the GUI application"""
+    # Log records are written to the terminal by a listener thread, so that a slow
+    # terminal does not block the event loop or the Tk main loop
+    log_listener = setup_queue_logging()
+    atexit.register(log_listener.stop)
+
     try:
         app = NervousGUI()
         app.run()
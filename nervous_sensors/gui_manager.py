@@ -1,6 +1,5 @@
 import logging
 import threading
-import traceback
 
 from .async_manager import AsyncManager
 from .viewer import RenforceViewer
@@ -46,7 +45,7 @@ class GUIManager(AsyncManager):
             self._server_thread.start()
         except Exception as e:
             logger.error(f"Error starting GUI manager: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
             raise
 
     async def stop(self):
@@ -63,4 +62,4 @@ class GUIManager(AsyncManager):
                 self._server_thread.join()
         except Exception as e:
             logger.error(f"Error stopping GUI manager: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
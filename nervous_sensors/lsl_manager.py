@@ -1,6 +1,4 @@
-import asyncio
 import logging
-import traceback
 
 from pylsl import StreamInfo, StreamOutlet, local_clock
 
@@ -64,7 +62,7 @@ class LSLManager(AsyncManager):
                 logger.debug(f"Created LSL outlet for sensor {name}")
         except Exception as e:
             logger.error(f"Error initializing LSL manager: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
             raise
 
     async def start(self):
@@ -77,15 +75,13 @@ class LSLManager(AsyncManager):
         logger.info("Starting LSL manager")
         logger.info(f"LSL offset clock: {self._start_time_lsl}")
 
-        while not self._stop_event.is_set():
+        while not self._stopping:
             try:
-                await asyncio.wait_for(self._stop_event.wait(), timeout=self._update_time)
-                self.send_data()
-            except asyncio.TimeoutError:
+                await self._wait_stop(self._update_time)
                 self.send_data()
             except Exception as e:
                 logger.error(f"Error in LSL manager loop: {str(e)}")
-                logger.debug(traceback.format_exc())
+                logger.debug("Traceback", exc_info=True)
 
     def send_data(self):
         """
@@ -101,7 +97,7 @@ class LSLManager(AsyncManager):
         Sets the stop event to terminate the running loop.
         """
         logger.info("Stopping LSL manager")
-        self._stop_event.set()
+        self._signal_stop()
 
     def send_data_generic(self, sensor_lsl):
         """
@@ -134,4 +130,4 @@ class LSLManager(AsyncManager):
             )
         except Exception as e:
             logger.error(f"{sensor.get_name()} LSL send error: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
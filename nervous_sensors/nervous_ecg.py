@@ -8,6 +8,10 @@ from .data_manager import DataManager
 from .nervous_sensor import NervousSensor
 
 ECG_SAMPLING_RATE = 512
+# Samples per packet, EcgBuffer.data holds 200 bytes of int16 samples
+ECG_PACKET_SAMPLES = 100
+# Electrode status for each lead-off detection value sent by the sensor
+LOD_STATUS = {0: "both on", 1: "left off", 2: "right off", 3: "both off"}
 logger = logging.getLogger("nervous")
 
 
@@ -79,6 +83,7 @@ class ECGDataManager(DataManager):
     Attributes:
         _sampling_rate (int): ECG sampling rate
         _codec (ECGCodec): Codec for decoding ECG data
+        _offsets (numpy.ndarray): Time offset of each sample of a packet
     """
 
     def __init__(self, sensor_name, sampling_rate, start_time):
@@ -97,23 +102,22 @@ class ECGDataManager(DataManager):
             start_time=start_time,
             codec=ECGCodec(),
         )
+        self._offsets = np.arange(ECG_PACKET_SAMPLES) / sampling_rate
 
     # implements
     def _process_decoded_data(self, timestamp, data):
         """
         Process decoded ECG data.
 
-        Convert samples and timestamps into time-series data points and
-        add them to the data store.
+        Compute the timestamp of each sample and add the samples to the data store.
 
         Args:
             timestamp (float): Timestamp of the first sample
-            data (list): List of ECG samples
+            data (numpy.ndarray): Array of ECG samples
         """
-        data_to_add = []
-        for i in range(len(data)):
-            data_to_add.append([timestamp + i * (1 / self._sampling_rate), data[i]])
-        self._add_data(data_to_add)
+        if len(data) > len(self._offsets):
+            self._offsets = np.arange(len(data)) / self._sampling_rate
+        self._add_data(timestamp + self._offsets[: len(data)], data)
 
 
 class ECGCodec(Codec):
@@ -125,14 +129,16 @@ class ECGCodec(Codec):
 
     Attributes:
         _lodpn (str): Status of electrodes ('both on', 'left off', etc.)
+        _pb_buffer_msg (pb2.EcgBuffer): Message reused for every decoded packet
     """
 
     def __init__(self):
         """Initialize the ECG codec with default electrode status."""
         self._lodpn = "both off"
+        self._pb_buffer_msg = pb2.EcgBuffer()
 
     # override
-    async def protobuf_decode(self, data):
+    def protobuf_decode(self, data):
         """
         Decode ECG data from a protobuf message.
 
@@ -142,22 +148,15 @@ class ECGCodec(Codec):
         Returns:
             tuple: (buffer_data, timestamp) containing the decoded samples and timestamp
         """
-        # parse the serialized message from a byte string
-        pb_buffer_msg = pb2.EcgBuffer()
+        # parse the serialized message from a byte string (ParseFromString clears previous content)
+        pb_buffer_msg = self._pb_buffer_msg
         pb_buffer_msg.ParseFromString(data)
-        if pb_buffer_msg.lodpn == 0:
-            self._lodpn = "both on"
-        if pb_buffer_msg.lodpn == 1:
-            self._lodpn = "left off"
-        if pb_buffer_msg.lodpn == 2:
-            self._lodpn = "right off"
-        if pb_buffer_msg.lodpn == 3:
-            self._lodpn = "both off"
+        # unknown values keep the previous status
+        self._lodpn = LOD_STATUS.get(pb_buffer_msg.lodpn, self._lodpn)
         # return self._reshape_data(type, pb_buffer_msg.data, pb_buffer_msg.timestamp)
         # def _reshape_data(self, type, buffer_msg_data, buffer_msg_timestamp):
         timestamp = pb_buffer_msg.timestamp.time + pb_buffer_msg.timestamp.us * 0.000001
-        buffer_data = np.frombuffer(pb_buffer_msg.data, np.int8)
-        buffer_data = buffer_data.view(np.int16)
+        buffer_data = np.frombuffer(pb_buffer_msg.data, np.int16)
         # elif type == "RENFORCE EDA":
         #    real = buffer_msg_data[0].real
         #    imag = buffer_msg_data[0].imag
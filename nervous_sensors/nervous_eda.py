@@ -1,6 +1,5 @@
 import logging
-
-import numpy as np
+import math
 
 from . import pb2
 from .codec import Codec
@@ -100,8 +99,7 @@ class EDADataManager(DataManager):
             timestamp (float): Timestamp of the sample
             data (float): EDA measurement value
         """
-        data_to_add = [[timestamp, data]]
-        self._add_data(data_to_add)
+        self._add_data((timestamp,), (data,))
 
 
 class EDACodec(Codec):
@@ -109,10 +107,17 @@ class EDACodec(Codec):
     Codec for decoding EDA data from protobuf messages.
 
     This class handles the decoding of binary EDA data.
+
+    Attributes:
+        _pb_buffer_msg (pb2.EdaBuffer): Message reused for every decoded packet
     """
 
+    def __init__(self):
+        """Initialize the EDA codec with a reusable protobuf message."""
+        self._pb_buffer_msg = pb2.EdaBuffer()
+
     # override
-    async def protobuf_decode(self, data):
+    def protobuf_decode(self, data):
         """
         Decode EDA data from a protobuf message.
 
@@ -122,14 +127,16 @@ class EDACodec(Codec):
         Returns:
             tuple: (buffer_data, timestamp) containing the decoded EDA value and timestamp
         """
-        # parse the serialized message from a byte string
-        pb_buffer_msg = pb2.EdaBuffer()
+        # parse the serialized message from a byte string (ParseFromString clears previous content)
+        pb_buffer_msg = self._pb_buffer_msg
         pb_buffer_msg.ParseFromString(data)
         # return self._reshape_data(type, pb_buffer_msg.data, pb_buffer_msg.timestamp)
         # def _reshape_data(self, type, buffer_msg_data, buffer_msg_timestamp):
         timestamp = pb_buffer_msg.timestamp.time + pb_buffer_msg.timestamp.us * 0.000001
         real = pb_buffer_msg.data[0].real
         imag = pb_buffer_msg.data[0].imag
-        buffer_data = np.sqrt(np.square(real) + np.square(imag))  # get impedance amgnitude of lowest frequency
-        buffer_data = 1000000 * 1 / buffer_data
+        # conductance from impedance magnitude of lowest frequency
+        impedance = math.hypot(real, imag)
+        # A missing value decodes as 0, keep infinite conductance as NumPy division gave
+        buffer_data = 1_000_000 / impedance if impedance else math.inf
         return buffer_data, timestamp
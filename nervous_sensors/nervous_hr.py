@@ -1,5 +1,4 @@
 import logging
-import traceback
 
 from nervous_analytics.analyzers import ECGAnalyzer
 
@@ -25,6 +24,7 @@ class NervousHR(NervousVirtual):
         _labels (list): List of data labels (["HR"])
         _units (list): List of measurement units (["BPM"])
         _analyzer (ECGAnalyzer): Analyzer for computing HR from ECG
+        _reinit_pending (bool): Whether the analyzer must be reinitialized before the next processing
         _plot_type (str): Type of plot to use for visualizing data
     """
 
@@ -54,6 +54,7 @@ class NervousHR(NervousVirtual):
         self._labels = ["HR"]
         self._units = ["BPM"]
         self._analyzer = ECGAnalyzer(fs=ecg_sensor.get_sampling_rate(), window_duration=5, history_size=5)
+        self._reinit_pending = False
         self._plot_type = "bar"
         self._electrode_status = "both on"
 
@@ -62,10 +63,13 @@ class NervousHR(NervousVirtual):
         """
         Start notifications and reinitialize HR detection algorithm.
 
+        The analyzer is reinitialized by the next processing call, in the worker thread,
+        as the last processing call of the previous notifications may still be using it.
+
         Returns:
             bool: Success status
         """
-        self._analyzer._reinit_history()
+        self._reinit_pending = True
         return await super().start_notifications()
 
     # This overrides the empty method of NervousVirtual and is called every HR_UPDATE_INTERVAL
@@ -76,6 +80,11 @@ class NervousHR(NervousVirtual):
         Fetches new ECG data since last processing, checks electrode status,
         and calculates heart rate using the ECG analyzer.
         """
+        # Reinitialize HR detection if notifications were restarted
+        if self._reinit_pending:
+            self._reinit_pending = False
+            self._analyzer._reinit_history()
+
         # Check for new samples since last processed
         data = self._sensor.data_manager.get_latest_data(latest_data=self._latest_data)
         if len(data.index) == 0:
@@ -96,15 +105,16 @@ class NervousHR(NervousVirtual):
 
         # Process samples
         try:
+            # Columns are passed as NumPy arrays, the analyzer converts them without boxing samples
             heart_rate, heart_rate_timestamp, _ = self._analyzer.update_hr(
-                data["ECG (A.U.)"].tolist(), data["Time (s)"].tolist()
+                data["ECG (A.U.)"].to_numpy(), data["Time (s)"].to_numpy()
             )
             # Add data to the data manager, with a list of timestamps and a list of HR values
             if heart_rate is not None:
                 self._data_manager._process_decoded_data(timestamp=heart_rate_timestamp, data=heart_rate)
         except Exception as e:
             logger.error("%s Processing error: %s", self.get_colored_name(), str(e))
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
 
 
 class HRDataManager(DataManager):
@@ -146,9 +156,6 @@ class HRDataManager(DataManager):
             data (list): List of HR values in BPM
         """
         try:
-            data_to_add = []
-            for i in range(len(data)):
-                data_to_add.append([timestamp[i], data[i]])
-            self._add_data(data_to_add)
+            self._add_data(timestamp, data)
         except Exception as e:
             logger.error("HR processing error: %s", str(e), exc_info=True)
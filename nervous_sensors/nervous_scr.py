@@ -1,5 +1,4 @@
 import logging
-import traceback
 
 import numpy as np
 from nervous_analytics.analyzers import EDAAnalyzer
@@ -102,8 +101,9 @@ class NervousSCR(NervousVirtual):
             return
         # Process samples
         try:
+            # Columns are passed as NumPy arrays, the analyzer converts them without boxing samples
             amplitude, duration, level, timestamp = self._analyzer.update_eda_peak(
-                data["EDA (uS)"].tolist(), data["Time (s)"].tolist()
+                data["EDA (uS)"].to_numpy(), data["Time (s)"].to_numpy()
             )
             if not timestamp:
                 return
@@ -116,7 +116,7 @@ class NervousSCR(NervousVirtual):
             self._data_manager._process_decoded_data(timestamp=timestamp, data=data_tosend)
         except Exception as e:
             logger.error("%s Processing error: %s", self.get_colored_name(), str(e))
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
 
 
 class SCRDataManager(DataManager):
@@ -160,10 +160,6 @@ class SCRDataManager(DataManager):
                             (amplitude, rise time, skin conductance level)
         """
         try:
-            data_to_add = []
-            for i in range(len(timestamp)):
-                data_to_add.append(np.hstack((timestamp[i], data[i])).tolist())
-                # data_to_add.append([[timestamp[i]] + data[i]])
-            self._add_data(data_to_add)
+            self._add_data(timestamp, data)
         except Exception as e:
             logger.error("SCR data processing error: %s", str(e), exc_info=True)
@@ -12,7 +12,6 @@ The module includes:
 
 import asyncio
 import logging
-import traceback
 from datetime import datetime
 
 from bleak import BleakClient, BleakScanner
@@ -270,7 +269,7 @@ class NervousSensor:
                 # Update embedded RTC
                 await self._client.write_gatt_char(
                     "6e400002-b5a3-f393-e0a9-e50e24dcca9e",
-                    await Codec.time_encode(),
+                    Codec.time_encode(),
                     response=False,
                 )
                 self._connection_manager.on_sensor_connect(self)
@@ -282,7 +281,7 @@ class NervousSensor:
 
         except Exception as ex:
             logger.error(f"{self.get_colored_name()} Error: {str(ex)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
             if connection_was_established:
                 self._connection_manager.on_sensor_disconnect(self)
             else:
@@ -84,7 +84,8 @@ class NervousVirtual(NervousSensor):
 
         This method blocks as long as the virtual connection is maintained.
         It handles the main event loop for data processing based on the
-        start and stop notification events.
+        start and stop notification events. Data processing runs in a
+        worker thread.
         """
         self._is_connected = True
         # dummy wait
@@ -95,10 +96,13 @@ class NervousVirtual(NervousSensor):
             self._start_event.clear()
             while not self._stop_event.is_set():
                 try:
-                    await asyncio.wait_for(self._stop_event.wait(), timeout=self._update_time)
-                    self._process_data()
+                    async with asyncio.timeout(self._update_time):
+                        await self._stop_event.wait()
                 except TimeoutError:
-                    self._process_data()
+                    pass
+                # Processing is CPU bound, run it in a worker thread to keep the event loop responsive.
+                # Calls are awaited one at a time so the data manager keeps a single producer.
+                await asyncio.to_thread(self._process_data)
             self._stop_event.clear()
         self._disconnect_event.clear()
         self._connection_manager.on_sensor_disconnect(self)
@@ -137,7 +141,7 @@ class NervousVirtual(NervousSensor):
         Process data for this virtual sensor.
 
         This method must be overridden by subclasses to implement
-        actual data processing logic. The default implementation
+        actual data processing logic. It is called from a worker thread. The default implementation
         simply logs a warning.
         """
         logger.warning(f"{self.get_colored_name()} _process_data() method not implemented")
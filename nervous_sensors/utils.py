@@ -1,11 +1,26 @@
 import logging
+import os
+import queue
+import sys
+from logging.handlers import QueueHandler, QueueListener
 
 logger = logging.getLogger("nervous")
 
+# Format of the log records written to the terminal
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Colors are only emitted when logs go to a terminal and NO_COLOR is not set (https://no-color.org)
+COLOR_ENABLED = sys.stderr.isatty() and not os.environ.get("NO_COLOR")
+
 # Terminal color codes
 RED = "\033[31m"
 GREEN = "\033[32m"
+GREY = "\033[38;5;245m"
+BOLD = "\033[1m"
+NORMAL = "\033[22m"
 RESET = "\033[0m"
+if not COLOR_ENABLED:
+    RED = GREEN = GREY = BOLD = NORMAL = RESET = ""
 
 # Help text for CLI options
 SENSORS_HELP = (
@@ -20,8 +35,11 @@ FOLDER_HELP = "Save CSV data files in folder. WARNING: The folder must exist as
 LSL_HELP = "Send sensor data on LSL outlets."
 PARALLEL_HELP = "Number of parallel connection tentatives authorized. This is optional and should not be set."
 
+# Translation table removing separators from sensor names (ECG_xxx, ECG-xxx -> ECGxxx)
+SEPARATORS_TABLE = str.maketrans("", "", "_-")
+
 # Available colors for different sensors or outputs
-colors = [
+colors = (
     # "\033[34m",  # blue
     # "\033[35m",  # magenta
     # "\033[36m",  # cyan
@@ -37,7 +55,9 @@ colors = [
     "\033[38;5;172m",  # brown
     "\033[38;5;105m",  # purple
     "\033[38;5;130m",  # violet
-]
+)
+if not COLOR_ENABLED:
+    colors = ("",)
 
 
 def print_green(info) -> str:
@@ -69,8 +89,8 @@ def print_bold(info):
     Args:
         section (str): Section header text.
     """
-    print("")
-    message = f"\033[1m{info}\033[22m\n"
+    sys.stdout.write("\n")
+    message = f"{BOLD}{info}{NORMAL}\n"
     return message
 
 
@@ -81,10 +101,35 @@ def print_grey(info):
     Args:
         info (str): Information message to display.
     """
-    message = f"\033[38;5;245m{info}\033[0m"
+    message = f"{GREY}{info}{RESET}"
     return message
 
 
+def setup_queue_logging(level=logging.INFO, stream=None):
+    """
+    Configure the root logger to write records to the terminal from a listener thread.
+
+    Records are put on a queue by the logging call and written by the listener,
+    so that a slow terminal does not block the event loop or the GUI. Any handler
+    already installed on the root logger is replaced.
+
+    Args:
+        level: Level of the root logger (default: logging.INFO).
+        stream: Stream to write records to (default: sys.stderr when called).
+
+    Returns:
+        QueueListener: The started listener, stop it to write the pending records.
+    """
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    listener = QueueListener(log_queue, handler)
+    # The queue handler only merges the message arguments, the listener applies LOG_FORMAT
+    logging.basicConfig(level=level, handlers=[QueueHandler(log_queue)], format="%(message)s", force=True)
+    listener.start()
+    return listener
+
+
 def get_color(i):
     """
     Get a color from the color palette based on an index.
@@ -115,10 +160,11 @@ def extract_sensors(sensors):
         logger.warning("Empty sensors list provided")
         return []
 
-    if "_" in sensors[0] or "-" in sensors[0]:
-        result = [f"{s[:3]}{s[4:]}" for s in sensors if "ecg" in s.lower() or "eda" in s.lower()]
-    else:
-        result = [s for s in sensors if "ecg" in s.lower() or "eda" in s.lower()]
+    result = []
+    for sensor in sensors:
+        lowered = sensor.lower()
+        if "ecg" in lowered or "eda" in lowered:
+            result.append(sensor.translate(SEPARATORS_TABLE))
 
     logger.debug(f"Extracted sensors: {result}")
     return result
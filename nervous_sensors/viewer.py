@@ -1,7 +1,6 @@
 import logging
 import socket
 import time
-import traceback
 from threading import Event, Thread
 
 import dash
@@ -14,8 +13,6 @@ from flask import Flask, request
 from plotly.subplots import make_subplots
 from werkzeug.serving import make_server
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 server = Flask(__name__)
@@ -107,7 +104,7 @@ class RenforceViewer:
             requests.post(f"http://localhost:{self.port}/shutdown")
         except Exception as e:
             logger.error(f"Error stopping server: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
 
     def run_server(self):
         """Start and run the server until shutdown is requested."""
@@ -137,7 +134,7 @@ class RenforceViewer:
             logger.info("Server shutdown complete")
         except Exception as e:
             logger.error(f"Error in run_server: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
 
     def get_sensors(self):
         """
@@ -207,7 +204,7 @@ def update_data(n):
                     )
         except Exception as e:
             logger.error(f"Error processing sensor {i}: {str(e)}")
-            logger.debug(traceback.format_exc())
+            logger.debug("Traceback", exc_info=True)
             continue
 
     fig.update_layout(
@@ -233,4 +230,4 @@ def shutdown_server():
             logger.warning("No werkzeug.server.shutdown function available")
     except Exception as e:
         logger.error(f"Error during server shutdown: {str(e)}")
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback", exc_info=True)
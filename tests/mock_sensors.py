@@ -34,6 +34,16 @@ def get_failed_sensor(manager):
     return mock_sensor
 
 
+def get_raising_sensor(manager):
+    """
+    :return: A mock sensor whose connection attempts raise an error.
+    """
+    mock_sensor = Mock(spec=NervousSensor)
+    mock_sensor.connect.side_effect = OSError("Connection error")
+    mock_sensor.is_connected.return_value = False
+    return mock_sensor
+
+
 def get_sensor_with_disconnection(manager):
     """
     :return: A mock sensor that will connect and has disconnections occurring.
@@ -5,7 +5,7 @@ import pytest
 
 from nervous_sensors.connection_manager import ConnectionManager
 
-from .mock_sensors import get_correct_sensor, get_failed_sensor, get_sensor_with_disconnection
+from .mock_sensors import get_correct_sensor, get_failed_sensor, get_raising_sensor, get_sensor_with_disconnection
 
 timeout = 2
 
@@ -95,6 +95,33 @@ async def test_failed_connection():
     assert sensors[2].connect.call_count >= 1
 
 
+@pytest.mark.asyncio
+async def test_raising_connection():
+    """
+    Test if a sensor whose connection attempts raise releases its connection slot
+    for the other sensors and retries with an exponential backoff.
+    """
+    manager = ConnectionManager(sensor_names=[], parallel_connection_authorized=1)
+    sensors = [
+        get_raising_sensor(manager),
+        get_correct_sensor(manager),
+        get_correct_sensor(manager),
+    ]
+
+    manager._sensors = sensors
+    await run_timeout_task(manager.start())
+
+    assert sensors[1].connect.call_count == 1
+    assert sensors[2].connect.call_count == 1
+    assert manager._semaphore._value == 1
+
+    # Retries are delayed by 2, 4, 8... seconds after each failed attempt
+    max_attempts = 1
+    while sum(2**attempt for attempt in range(1, max_attempts + 1)) <= timeout:
+        max_attempts += 1
+    assert 1 <= sensors[0].connect.call_count <= max_attempts
+
+
 @pytest.mark.asyncio
 async def test_connection_with_disconnection():
     """
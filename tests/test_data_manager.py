@@ -0,0 +1,150 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from nervous_sensors.data_manager import BUFFER_SIZE, DataManager
+
+
+class RowsDataManager(DataManager):
+    """
+    Data manager storing the rows it receives as is.
+    """
+
+    def __init__(self):
+        super().__init__(
+            sensor_name="TEST",
+            sampling_rate=0,
+            header=["Time (s)", "A", "B"],
+            start_time=0,
+            codec=None,
+        )
+
+    def _process_decoded_data(self, timestamp, data):
+        data = np.asarray(data)
+        self._add_data(timestamp, np.column_stack((data, -data)))
+
+
+def test_last_n():
+    """
+    Test if the last rows are returned in chronological order.
+    """
+    manager = RowsDataManager()
+    manager._process_decoded_data([1, 2, 3], [10, 20, 30])
+
+    data = manager.get_latest_data(last_n=2)
+    assert data.values.tolist() == [[2, 20, -20], [3, 30, -30]]
+    assert len(manager.get_latest_data(last_n=-1)) == 3
+
+
+def test_latest_data():
+    """
+    Test if only rows newer than the given timestamp are returned.
+    """
+    manager = RowsDataManager()
+    manager._process_decoded_data([1, 2, 3, 4], [10, 20, 30, 40])
+
+    data = manager.get_latest_data(latest_data=2)
+    assert data["Time (s)"].tolist() == [3, 4]
+    assert manager.get_latest_data(latest_data=4).empty
+
+
+def test_concerned_columns():
+    """
+    Test if columns can be selected by name or by index.
+    """
+    manager = RowsDataManager()
+    manager._process_decoded_data([1, 2], [10, 20])
+
+    by_name = manager.get_latest_data(last_n=-1, concerned_columns=["Time (s)", "B"])
+    by_index = manager.get_latest_data(last_n=-1, concerned_columns=[0, 2])
+    assert list(by_name.columns) == ["Time (s)", "B"]
+    assert by_name.equals(by_index)
+    assert by_name["B"].tolist() == [-10, -20]
+
+
+def test_mismatched_shape():
+    """
+    Test if values not matching the timestamps and header columns are rejected
+    without storing any row.
+    """
+    manager = RowsDataManager()
+    with pytest.raises(ValueError):
+        manager._add_data([1, 2], [10, 20])
+    with pytest.raises(ValueError):
+        manager._add_data([1, 2], [10, 20, 30, 40, 50, 60])
+    with pytest.raises(ValueError):
+        manager._add_data([1, 2], [10, 20, 30])
+
+    assert manager.get_latest_data(last_n=-1).empty
+
+
+def test_buffer_wrap():
+    """
+    Test if the oldest rows are overwritten once the buffer is full
+    and rows stay in chronological order.
+    """
+    manager = RowsDataManager()
+    total = BUFFER_SIZE + 500
+    for start in range(0, total, 300):
+        timestamps = list(range(start, min(start + 300, total)))
+        manager._process_decoded_data(timestamps, timestamps)
+
+    data = manager.get_latest_data(last_n=-1)
+    assert len(data) == BUFFER_SIZE
+    assert data["Time (s)"].tolist() == list(range(total - BUFFER_SIZE, total))
+    assert manager.get_latest_data(latest_data=total - 3)["A"].tolist() == [total - 2, total - 1]
+    assert len(manager.get_latest_data(latest_data=1000)) == total - 1001
+
+
+@pytest.mark.parametrize("chunk_size", [64, 5000])
+def test_concurrent_reads(chunk_size):
+    """
+    Test if rows read while another thread is writing are never torn
+    by the producer overwriting the oldest rows, and if rows read from
+    a timestamp are all newer than it.
+    """
+    manager = RowsDataManager()
+    stop = threading.Event()
+
+    def produce():
+        start = 0
+        while not stop.is_set():
+            timestamps = np.arange(start, start + chunk_size, dtype=np.float64)
+            manager._process_decoded_data(timestamps, timestamps)
+            start += chunk_size
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    try:
+        latest_data = -1
+        end = time.monotonic() + 1
+        while time.monotonic() < end:
+            rows = manager.get_latest_data(last_n=-1).values
+            if len(rows) > 0:
+                assert np.all(np.diff(rows[:, 0]) == 1)
+                assert np.array_equal(rows[:, 1], rows[:, 0])
+                assert np.array_equal(rows[:, 2], -rows[:, 0])
+
+            rows = manager.get_latest_data(latest_data=latest_data, as_numpy=True)
+            if len(rows) > 0:
+                assert rows[0, 0] > latest_data
+                assert np.all(np.diff(rows[:, 0]) == 1)
+                latest_data = rows[-1, 0]
+    finally:
+        stop.set()
+        producer.join()
+
+
+def test_as_numpy():
+    """
+    Test if data can be returned as a NumPy array with the same content as the DataFrame.
+    """
+    manager = RowsDataManager()
+    manager._process_decoded_data([1, 2, 3], [10, 20, 30])
+
+    data = manager.get_latest_data(latest_data=1, as_numpy=True)
+    assert isinstance(data, np.ndarray)
+    assert data.tolist() == manager.get_latest_data(latest_data=1).values.tolist()
+    assert manager.get_latest_data(latest_data=3, as_numpy=True).shape == (0, 3)
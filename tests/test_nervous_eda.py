@@ -0,0 +1,33 @@
+import math
+
+from nervous_sensors.nervous_eda import EDACodec, pb2
+
+
+def encode_impedance(real, imag):
+    """
+    Serialize an EDA buffer with a single impedance value.
+    """
+    message = pb2.EdaBuffer()
+    value = message.data.add()
+    value.real = real
+    value.imag = imag
+    message.timestamp.time = 12
+    message.timestamp.us = 500_000
+    return message.SerializeToString()
+
+
+def test_protobuf_decode():
+    """
+    Test if the conductance is decoded from the impedance magnitude.
+    """
+    conductance, timestamp = EDACodec().protobuf_decode(encode_impedance(3, 4))
+    assert conductance == 200_000
+    assert timestamp == 12.5
+
+
+def test_protobuf_decode_zero_impedance():
+    """
+    Test if a zero impedance, as decoded from missing fields, gives an infinite conductance.
+    """
+    conductance, _ = EDACodec().protobuf_decode(encode_impedance(0, 0))
+    assert conductance == math.inf
@@ -0,0 +1,36 @@
+from unittest.mock import Mock
+
+import pandas as pd
+import pytest
+
+from nervous_sensors.nervous_ecg import NervousECG
+from nervous_sensors.nervous_hr import NervousHR
+
+
+def get_hr_sensor():
+    """
+    :return: A HR sensor on a mock ECG sensor without data, with a mock analyzer.
+    """
+    ecg_sensor = Mock(spec=NervousECG)
+    ecg_sensor.get_name.return_value = "ECG1234"
+    ecg_sensor.get_sampling_rate.return_value = 512
+    ecg_sensor.data_manager.get_latest_data.return_value = pd.DataFrame()
+    hr_sensor = NervousHR(ecg_sensor, start_time=0, timeout=1, connection_manager=Mock())
+    hr_sensor._analyzer = Mock()
+    return hr_sensor
+
+
+@pytest.mark.asyncio
+async def test_reinit_in_processing():
+    """
+    Test if starting notifications defers the analyzer reinitialization
+    to the next processing call, which runs in the worker thread.
+    """
+    hr_sensor = get_hr_sensor()
+
+    await hr_sensor.start_notifications()
+    hr_sensor._analyzer._reinit_history.assert_not_called()
+
+    hr_sensor._process_data()
+    hr_sensor._process_data()
+    hr_sensor._analyzer._reinit_history.assert_called_once()
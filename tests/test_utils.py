@@ -0,0 +1,28 @@
+import io
+import logging
+from logging.handlers import QueueHandler
+
+import nervous_sensors.cli  # noqa: F401 (imports every module that could configure logging)
+from nervous_sensors.utils import setup_queue_logging
+
+
+def test_queue_logging():
+    """
+    Test if records logged after the setup go through the queue to the listener,
+    even once all the framework modules are imported.
+    """
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    stream = io.StringIO()
+    try:
+        listener = setup_queue_logging(stream=stream)
+        assert [type(handler) for handler in root.handlers] == [QueueHandler]
+
+        logging.getLogger("nervous").info("queued record")
+        listener.stop()
+        assert "nervous - INFO - queued record" in stream.getvalue()
+    finally:
+        for handler in root.handlers:
+            handler.close()
+        root.handlers[:] = handlers
+        root.setLevel(level)